@@ -1,6 +1,9 @@
 import time
+import threading
 import requests
 import logging
+from collections import deque
+from concurrent.futures import Future, FIRST_COMPLETED, wait
 from typing import Generator, Any, Union, TypedDict
 from abc import abstractmethod, ABC
 
@@ -16,20 +19,155 @@ class Configuration(TypedDict):
     params: dict[str, str]
 
 
+class LatencyTracker:
+    """
+    Keeps a rolling window of response latencies (in seconds) to derive percentiles.
+    """
+
+    def __init__(self, window_size: int = 200):
+        self._samples = deque(maxlen=window_size)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def record(self, latency: float) -> None:
+        with self._lock:
+            self._samples.append(latency)
+
+    def percentile(self, percentile: float) -> Union[float, None]:
+        """
+        Returns the latency at the given percentile (nearest-rank), or None when no
+        samples exist.
+        """
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        rank = max(int(round(percentile / 100 * len(samples))) - 1, 0)
+        return samples[min(rank, len(samples) - 1)]
+
+
+class RateLimiter:
+    """
+    Spaces out requests so the client stays within a requests-per-second budget.
+    """
+
+    def __init__(self, rate: float):
+        self._interval = 1 / rate
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def next_slot(self) -> float:
+        """
+        Returns the monotonic time at which the next request slot opens.
+        """
+        with self._lock:
+            return self._next_slot
+
+    def acquire(self, blocking: bool = True) -> bool:
+        """
+        Reserves the next request slot. When blocking is False, returns False instead
+        of waiting.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self._next_slot <= now:
+                self._next_slot = now + self._interval
+                return True
+            if not blocking:
+                return False
+            wait_for = self._next_slot - now
+            self._next_slot += self._interval
+        time.sleep(wait_for)
+        return True
+
+
+def _close_response(future: Future) -> None:
+    """
+    Releases the connection held by a request that lost a hedging race.
+    """
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+
+def _is_ok(future: Future) -> bool:
+    return future.exception() is None and future.result().ok
+
+
+def _submit(fn, *args) -> Future:
+    """
+    Runs fn on a daemon thread so an in-flight request never blocks interpreter exit.
+    """
+    future = Future()
+
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+
 class HTTPClient(ABC):
     _DEFAULT_MAX_RETRY: int = 5
+    _DEFAULT_CONNECT_TIMEOUT: float = 5
+    _DEFAULT_READ_TIMEOUT: float = 30
+    _DEFAULT_RATE_LIMIT: float = 5  # requests per second
+    _DEFAULT_HEDGE_PERCENTILE: float = 95
+    _DEFAULT_HEDGE_MIN_SAMPLES: int = 20
+    _DEFAULT_HEDGE_BUDGET: float = 0.05  # max share of requests that can be hedged
 
     def __init__(self, config: Configuration):
         self._session = requests.Session()
+        self._hedge_session = requests.Session()
+        self._rate_limiter = RateLimiter(self._DEFAULT_RATE_LIMIT)
+        self._latency = LatencyTracker()
+        self._requests_sent = 0
+        self._hedges_sent = 0
         self.authenticator = Authenticator(config.get("apikey"))
         self._url = config.get("url")
         self._params = config.get("params")
         self.logger = logging.getLogger("HTTPClient")
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes the underlying sessions. Requests still running after losing a hedging
+        race are left to finish on their own daemon threads.
+        """
+        self._session.close()
+        self._hedge_session.close()
+
     @property
     def http_method(self) -> str:
         return "GET"
 
+    @property
+    def timeout(self) -> tuple[float, float]:
+        """
+        Returns the (connect, read) deadlines in seconds applied to every request.
+        """
+        return (self._DEFAULT_CONNECT_TIMEOUT, self._DEFAULT_READ_TIMEOUT)
+
+    @property
+    def hedge_requests(self) -> bool:
+        """
+        Whether slow requests can be duplicated. Only idempotent methods are safe to
+        hedge.
+        """
+        return self.http_method == "GET"
+
     @property
     def url(self) -> str:
         return self._url
@@ -83,6 +221,88 @@ class HTTPClient(ABC):
         }
         return self._session.prepare_request(requests.Request(**request_args))
 
+    def _timed_send(
+        self, session: requests.Session, request: requests.PreparedRequest
+    ) -> requests.Response:
+        """
+        Sends a request within the configured deadlines and records its latency
+        """
+        start = time.monotonic()
+        try:
+            return session.send(request, timeout=self.timeout)
+        finally:
+            self._latency.record(time.monotonic() - start)
+
+    def _hedge_threshold(self) -> Union[float, None]:
+        """
+        Returns how long to wait before hedging a request, or None if hedging is not
+        possible yet
+        """
+        if (
+            not self.hedge_requests
+            or len(self._latency) < self._DEFAULT_HEDGE_MIN_SAMPLES
+        ):
+            return None
+        return self._latency.percentile(self._DEFAULT_HEDGE_PERCENTILE)
+
+    def _within_hedge_budget(self) -> bool:
+        """
+        Checks that hedging one more request keeps duplicates within the hedge budget
+        """
+        return self._hedges_sent < self._DEFAULT_HEDGE_BUDGET * self._requests_sent
+
+    def _send(self, request: requests.PreparedRequest) -> requests.Response:
+        """
+        Sends a request, duplicating it if it has not answered by the hedge threshold.
+        The first successful response wins and the other request is cancelled or closed.
+        """
+        self._rate_limiter.acquire()
+        self._requests_sent += 1
+        hedge_after = self._hedge_threshold()
+        if hedge_after is None:
+            return self._timed_send(self._session, request)
+
+        hedge_at = time.monotonic() + hedge_after
+        primary = _submit(self._timed_send, self._session, request)
+        while True:
+            if not self._within_hedge_budget():
+                return primary.result()
+            # Wait for the hedge threshold, or the next free slot if the limiter is busy
+            timeout = max(hedge_at, self._rate_limiter.next_slot) - time.monotonic()
+            done, _ = wait([primary], timeout=max(timeout, 0))
+            if done:
+                return primary.result()
+            if self._rate_limiter.acquire(blocking=False):
+                break
+
+        self._hedges_sent += 1
+        self.logger.debug(
+            f"No response after {hedge_after:.2f} seconds. Hedging request."
+        )
+        hedge = _submit(self._timed_send, self._hedge_session, request.copy())
+        pending = {primary, hedge}
+        failed = []
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            winner = next((future for future in done if _is_ok(future)), None)
+            if winner is not None:
+                for other in (*done, *pending, *failed):
+                    if other is not winner:
+                        other.cancel()
+                        other.add_done_callback(_close_response)
+                return winner.result()
+            failed.extend(done)
+
+        # Neither request succeeded: prefer an error response so the retry handler
+        # can inspect its status code
+        responses = [future for future in failed if future.exception() is None]
+        if responses:
+            for other in failed:
+                if other is not responses[-1]:
+                    _close_response(other)
+            return responses[-1].result()
+        raise failed[-1].exception()
+
     def send_request(self, next_page: str = None) -> requests.Response:
         """
         Sends a request to the API with exponential backoff and retries
@@ -91,7 +311,7 @@ class HTTPClient(ABC):
         retries = 0
         while retries < self._DEFAULT_MAX_RETRY:
             try:
-                response = self._session.send(request)
+                response = self._send(request)
                 response.raise_for_status()
                 return response
             except requests.exceptions.RequestException as e:
@@ -100,12 +320,13 @@ class HTTPClient(ABC):
                 if retries >= self._DEFAULT_MAX_RETRY:
                     self.logger.error(f"Request failed after {retries} retries: {e}.")
                     raise SystemExit(e)
-                if e.response.status_code == 429:
+                status_code = e.response.status_code if e.response is not None else None
+                if status_code == 429:
                     retry_after = 1 / 5  # 5 requests per second
                     self.logger.warning(
                         f"Rate limit exceeded. Retrying after {retry_after} seconds."
                     )
-                elif e.response.status_code == 401:
+                elif status_code == 401:
                     self.logger.error("Unauthorized request. Check your API key.")
                     raise SystemExit(e)
                 else:
@@ -44,22 +44,23 @@ def main(
 
     if not skip_extraction:
         logger.info(f"Starting extraction from {config['params']['startDateTime']}")
-        events_stream = EventsStream(config=config)
-
-        for response in events_stream.read_pages():
-            data = response.json()
-            if data["page"]["totalElements"] == 0:
-                logger.info("No events found.")
-                break
-            events = response.json().get("_embedded").get("events")
-            # Apply preprocessing to ensure consistency
-            df = process_dataframe(pd.json_normalize(filter_dicts(events, event_keys)))
-            file_path = upload_dataframe_to_gcs(
-                df, getenv("CLOUD_STORAGE_BUCKET"), "events"
-            )
-            logger.info(f"Uploaded {file_path}.")
-
-            latest_timestamp = df.iloc[-1]["dates_start_dateTime"]
+        with EventsStream(config=config) as events_stream:
+            for response in events_stream.read_pages():
+                data = response.json()
+                if data["page"]["totalElements"] == 0:
+                    logger.info("No events found.")
+                    break
+                events = response.json().get("_embedded").get("events")
+                # Apply preprocessing to ensure consistency
+                df = process_dataframe(
+                    pd.json_normalize(filter_dicts(events, event_keys))
+                )
+                file_path = upload_dataframe_to_gcs(
+                    df, getenv("CLOUD_STORAGE_BUCKET"), "events"
+                )
+                logger.info(f"Uploaded {file_path}.")
+
+                latest_timestamp = df.iloc[-1]["dates_start_dateTime"]
 
         logger.info("Loading available data to BigQuery.")
         save_latest_timestamp(
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# main.py runs with loader/ as the import root, mirror that for the tests
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
@@ -0,0 +1,173 @@
+import threading
+import time
+
+import pytest
+import requests
+
+from http_client import http
+from http_client.http import HTTPClient, RateLimiter
+
+
+class StubResponse(requests.Response):
+    def __init__(self, status_code: int):
+        super().__init__()
+        self.status_code = status_code
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class StubSession(requests.Session):
+    """
+    Replays a script of outcomes. Each outcome is a status code, an exception, or a
+    (threading.Event, status code) pair that blocks until the event is set.
+    """
+
+    def __init__(self, *outcomes):
+        super().__init__()
+        self.outcomes = list(outcomes)
+        self.calls = []
+        self.responses = []
+
+    def send(self, request, **kwargs):
+        self.calls.append((time.monotonic(), kwargs))
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, tuple):
+            event, outcome = outcome
+            event.wait(5)
+        if isinstance(outcome, Exception):
+            raise outcome
+        response = StubResponse(outcome)
+        self.responses.append(response)
+        return response
+
+
+class StubClient(HTTPClient):
+    _DEFAULT_RATE_LIMIT = 5
+
+    def path(self):
+        return "https://example.com/events.json"
+
+    def next_page(self, response):
+        return None
+
+    def get_headers(self, next_page):
+        return {}
+
+    def get_params(self, next_page):
+        return {}
+
+
+def make_client(primary, hedge=None, warm=True):
+    client = StubClient({"url": "", "apikey": "key", "params": {}})
+    client._session = primary
+    client._hedge_session = hedge or StubSession()
+    if warm:
+        for _ in range(client._DEFAULT_HEDGE_MIN_SAMPLES):
+            client._latency.record(0.01)
+        client._requests_sent = client._DEFAULT_HEDGE_MIN_SAMPLES
+    return client
+
+
+def wait_until(predicate, timeout=2):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_rate_limiter_refuses_busy_slot_without_blocking():
+    limiter = RateLimiter(5)
+    assert limiter.acquire(blocking=False)
+    assert not limiter.acquire(blocking=False)
+    assert limiter.next_slot > time.monotonic()
+
+
+def test_requests_carry_connect_and_read_deadlines():
+    session = StubSession(200)
+    make_client(session, warm=False).send_request()
+    assert session.calls[0][1]["timeout"] == (5, 30)
+
+
+def test_stalled_request_is_hedged_once_a_rate_slot_opens():
+    stall = threading.Event()
+    primary = StubSession((stall, 200))
+    hedge = StubSession(200)
+    client = make_client(primary, hedge)
+
+    start = time.monotonic()
+    response = client.send_request()
+    elapsed = time.monotonic() - start
+
+    assert response is hedge.responses[0]
+    assert client._hedges_sent == 1
+    # The p95 is 10 ms, but the primary request holds the 200 ms rate slot
+    assert hedge.calls[0][0] - primary.calls[0][0] >= 0.19
+    assert elapsed < 1
+
+    stall.set()
+    assert wait_until(lambda: primary.responses and primary.responses[0].closed)
+
+
+def test_hedge_is_skipped_once_budget_is_spent():
+    stall = threading.Event()
+    primary = StubSession((stall, 200))
+    hedge = StubSession(200)
+    client = make_client(primary, hedge)
+    client._requests_sent -= 1
+    client._hedges_sent = 1  # 1 hedge out of 20 requests is the 5% budget
+
+    threading.Timer(0.4, stall.set).start()
+    response = client.send_request()
+
+    assert response is primary.responses[0]
+    assert hedge.calls == []
+    assert client._hedges_sent == 1
+
+
+def test_error_response_does_not_win_the_race():
+    stall = threading.Event()
+    primary = StubSession((stall, 200))
+    hedge = StubSession(429)
+    client = make_client(primary, hedge)
+
+    threading.Timer(0.4, stall.set).start()
+    response = client.send_request()
+
+    assert response is primary.responses[0]
+    assert response.status_code == 200
+    assert hedge.responses[0].closed
+
+
+def test_failed_sends_are_recorded_as_latency_samples(monkeypatch):
+    monkeypatch.setattr(http.time, "sleep", lambda seconds: None)
+    session = StubSession(requests.exceptions.ReadTimeout("timed out"), 200)
+    client = make_client(session, warm=False)
+    client._rate_limiter = RateLimiter(1000)
+
+    client.send_request()
+
+    assert len(client._latency) == 2
+
+
+def test_errors_without_a_response_are_retried(monkeypatch):
+    monkeypatch.setattr(http.time, "sleep", lambda seconds: None)
+    session = StubSession(requests.exceptions.ConnectionError("reset"), 200)
+    client = make_client(session, warm=False)
+    client._rate_limiter = RateLimiter(1000)
+
+    assert client.send_request().status_code == 200
+    assert len(session.calls) == 2
+
+
+def test_errors_without_a_response_exit_after_max_retries(monkeypatch):
+    monkeypatch.setattr(http.time, "sleep", lambda seconds: None)
+    timeout = requests.exceptions.ConnectTimeout("timed out")
+    session = StubSession(*[timeout] * StubClient._DEFAULT_MAX_RETRY)
+    client = make_client(session, warm=False)
+    client._rate_limiter = RateLimiter(1000)
+
+    with pytest.raises(SystemExit):
+        client.send_request()
+    assert len(session.calls) == StubClient._DEFAULT_MAX_RETRY